@@ -24,6 +24,6 @@ setuptools.setup(
     keywords=["mpt", "mpr", "mps", "biologic", "ec-lab"],
     package_dir={"": "src"},
     packages=setuptools.find_packages(where="src"),
-    install_requires=["numpy", "pandas", "openpyxl"],
-    python_requires=">=3.9",
+    install_requires=["numpy", "pandas>=3", "openpyxl"],
+    python_requires=">=3.11",
 )
@@ -8,12 +8,34 @@ See the individual parsers to get an idea of the data formats used.
 .. codeauthor:: Nicolas Vetsch <vetschnicolas@gmail.com>
 """
 import os
+from concurrent.futures import ThreadPoolExecutor
 
+import numpy as np
+import openpyxl
 import pandas as pd
 
 from eclabfiles import mpr, mps, mpt
 
 
+def _split_fn(fn: str) -> tuple[str, str, str]:
+    """Splits a file name into directory, stem and extension.
+
+    Parameters
+    ----------
+    fn
+        The path to some file.
+
+    Returns
+    -------
+    tuple[str, str, str]
+        The directory, the file name stem and the extension.
+
+    """
+    head, tail = os.path.split(fn)
+    stem, ext = os.path.splitext(tail)
+    return head, stem, ext
+
+
 def _construct_fn(other_fn: str, ext: str) -> str:
     """Constructs a new file name from the given name and extension.
 
@@ -30,10 +52,83 @@ def _construct_fn(other_fn: str, ext: str) -> str:
         A new file name with the given extension.
 
     """
-    head, tail = os.path.split(other_fn)
-    tail, __ = os.path.splitext(tail)
-    this_fn = os.path.join(head, tail + ext)
-    return this_fn
+    head, stem, __ = _split_fn(other_fn)
+    return os.path.join(head, stem + ext)
+
+
+def _data_to_df(data) -> pd.DataFrame:
+    """Builds a DataFrame from parsed data.
+
+    Structured arrays are wrapped column-by-column, letting pandas
+    reuse the contiguous per-field buffers instead of re-inferring
+    dtypes from records.
+
+    Parameters
+    ----------
+    data
+        The data parsed from an EC-Lab file, either a structured array
+        or a list of records.
+
+    Returns
+    -------
+    pd.DataFrame
+        The data as DataFrame.
+
+    """
+    if isinstance(data, np.ndarray):
+        return pd.DataFrame({name: data[name] for name in data.dtype.names})
+    if not data:
+        return pd.DataFrame()
+    # All records share one schema, so passing the columns explicitly
+    # spares pandas the per-record key union.
+    return pd.DataFrame.from_records(data, columns=list(data[0]))
+
+
+# Small cache so that converting one file to several formats
+# back-to-back only parses it once. Keyed on the file's stat info to
+# invalidate whenever the file changes on disk. Cached frames are handed
+# out as shallow copies, which is only safe under copy-on-write, hence
+# the pandas>=3 requirement.
+_df_cache = {}
+_df_cache_size = 4
+
+
+# Columns that keep full double precision when downcasting, so that
+# closely spaced timestamps stay monotonic.
+_time_columns = {"time", "uts"}
+
+
+def _single_precision(df: pd.DataFrame) -> pd.DataFrame:
+    """Casts float64 data columns down to float32.
+
+    EC-Lab instruments log with roughly 6 significant digits, so
+    single precision loses no measured information while halving the
+    bytes the exporters have to format. Time columns are exempt to
+    preserve monotonicity.
+
+    Parameters
+    ----------
+    df
+        The DataFrame to downcast.
+
+    Returns
+    -------
+    pd.DataFrame
+        The DataFrame with float64 data columns as float32.
+
+    """
+    cast = {
+        column: "float32"
+        for column in df.select_dtypes("float64").columns
+        if column not in _time_columns
+    }
+    return df.astype(cast)
+
+
+# Maps normalized file extensions to the corresponding parser, so new
+# formats only need a registration here rather than another branch in
+# process().
+_parsers = {".mpt": mpt.process, ".mpr": mpr.process, ".mps": mps.process}
 
 
 def process(fn: str, encoding: str = "windows-1252", **kwargs) -> tuple[dict, dict]:
@@ -68,22 +163,23 @@ def process(fn: str, encoding: str = "windows-1252", **kwargs) -> tuple[dict, di
         files. Possible options are "mpr" and "mpt".
 
     """
-    __, ext = os.path.splitext(fn)
-    if ext == ".mpt":
-        return mpt.process(fn, encoding=encoding)
-    if ext == ".mpr":
-        return mpr.process(fn, encoding=encoding)
+    ext = _split_fn(fn)[2].lower()
+    parser = _parsers.get(ext)
+    if parser is None:
+        raise NotImplementedError(f"Unrecognized file extension: {ext}")
     if ext == ".mps":
-        return mps.process(
+        return parser(
             fn,
             encoding=encoding,
             load_data=kwargs.get("load_data", False),
             load_type=kwargs.get("load_type", None),
         )
-    raise NotImplementedError(f"Unrecognized file extension: {ext}")
+    return parser(fn, encoding=encoding)
 
 
-def to_df(fn: str, encoding: str = "windows-1252", **kwargs) -> pd.DataFrame:
+def to_df(
+    fn: str, encoding: str = "windows-1252", precision: str = "double", **kwargs
+) -> pd.DataFrame:
     """Extracts data from an EC-Lab file and returns it as DataFrame.
 
     The function finds the file extension and tries to choose the
@@ -100,6 +196,11 @@ def to_df(fn: str, encoding: str = "windows-1252", **kwargs) -> pd.DataFrame:
         The path to an EC-Lab file.
     encoding
         Encoding of ``fn``, by default "windows-1252".
+    precision
+        Either "double" (default) or "single". With "single", float64
+        data columns are cast down to float32, which halves the memory
+        footprint without losing measured information. Time columns
+        always stay float64.
 
     Returns
     -------
@@ -115,32 +216,175 @@ def to_df(fn: str, encoding: str = "windows-1252", **kwargs) -> pd.DataFrame:
         files. Possible options are "mpr" and "mpt".
 
     """
-    __, ext = os.path.splitext(fn)
+    if precision not in {"double", "single"}:
+        raise ValueError(f"Unrecognized precision: {precision}")
+    stat = os.stat(fn)
+    cache_key = (
+        os.path.abspath(fn),
+        stat.st_mtime_ns,
+        stat.st_size,
+        encoding,
+        precision,
+        kwargs.get("load_type"),
+    )
+    if cache_key in _df_cache:
+        return _df_cache[cache_key].copy(deep=False)
+    ext = _split_fn(fn)[2].lower()
     if ext in {".mpt", ".mpr"}:
         data, meta = process(fn, encoding=encoding)
-        df = pd.DataFrame.from_records(data)
+        df = _data_to_df(data)
         df.attrs = meta
     elif ext == ".mps":
-        techniques, meta = mps.process(
+        techniques, meta = process(
             fn,
             encoding=encoding,
             load_data=True,
             load_type=kwargs.get("load_type", "mpr"),
         )
-        dfs = {}
-        for num, technique in techniques.items():
-            if "data" in technique:
-                dfs[num] = pd.DataFrame.from_records(technique.pop("data"))
+        dfs = {
+            num: _data_to_df(technique.pop("data"))
+            for num, technique in techniques.items()
+            if "data" in technique
+        }
         df = pd.concat(dfs, names=["Technique"])
         df.attrs = meta | {"techniques": techniques}
     else:
         raise ValueError(f"Unrecognized file extension: {ext}")
+    if precision == "single":
+        df = _single_precision(df)
+    if len(_df_cache) >= _df_cache_size:
+        _df_cache.pop(next(iter(_df_cache)))
+    _df_cache[cache_key] = df.copy(deep=False)
     return df
 
 
-def to_csv(fn: str, encoding: str = "windows-1252", csv_fn: str = None) -> None:
+def _write_csv(
+    df: pd.DataFrame, csv_fn: str, float_format: str = None, engine: str = "auto"
+) -> None:
+    """Writes a DataFrame to csv, through pyarrow where available.
+
+    pyarrow's csv writer is multithreaded C++ and considerably faster
+    than the pandas formatter on large frames. Without pyarrow, or
+    when an explicit float format is requested, this falls back to
+    DataFrame.to_csv. The optional "polars" engine hands the columns
+    to polars' Rust csv writer instead.
+
+    Parameters
+    ----------
+    df
+        The DataFrame to write.
+    csv_fn
+        Path to the csv file to write.
+    float_format
+        Format string for floats, by default None (shortest repr that
+        round-trips).
+    engine
+        Either "auto" (default, pyarrow with a pandas fallback) or
+        "polars", which needs the polars package installed.
+
+    """
+    if isinstance(df.index, pd.MultiIndex):
+        # Keep the technique number of settings file data as a column.
+        df = df.reset_index(level="Technique")
+    if engine == "polars":
+        # Imported on demand as polars is an optional dependency.
+        import polars as pl
+
+        pl.from_pandas(df).write_csv(csv_fn)
+        return
+    if engine != "auto":
+        raise ValueError(f"Unrecognized engine: {engine}")
+    if float_format is None:
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+
+            table = pa.Table.from_pandas(df, preserve_index=False)
+            pa_csv.write_csv(table, csv_fn)
+            return
+        except ImportError:
+            pass
+    df.to_csv(csv_fn, index=False, float_format=float_format)
+
+
+def _write_data_csv(
+    data,
+    csv_fn: str,
+    float_format: str = None,
+    precision: str = "double",
+    engine: str = "auto",
+) -> None:
+    """Writes parsed data to csv, avoiding pandas where possible.
+
+    Structured arrays are handed to pyarrow column-by-column without
+    materialising a DataFrame first. Record lists, explicit float
+    formats and downcasting requests go through the DataFrame path.
+
+    Parameters
+    ----------
+    data
+        The data parsed from an EC-Lab file, either a structured array
+        or a list of records.
+    csv_fn
+        Path to the csv file to write.
+    float_format
+        Format string for floats, by default None (shortest repr that
+        round-trips).
+    precision
+        Either "double" (default) or "single", see ``to_df``.
+    engine
+        Either "auto" (default) or "polars", see ``_write_csv``.
+
+    """
+    if precision == "single":
+        df = _single_precision(_data_to_df(data))
+        _write_csv(df, csv_fn, float_format=float_format, engine=engine)
+        return
+    if engine == "polars" and isinstance(data, np.ndarray):
+        import polars as pl
+
+        pl.DataFrame(data).write_csv(csv_fn)
+        return
+    if engine == "auto" and float_format is None and isinstance(data, np.ndarray):
+        try:
+            import pyarrow as pa
+            from pyarrow import csv as pa_csv
+        except ImportError:
+            # Without pyarrow, arrays whose fields all share one dtype
+            # can still skip pandas: view the records as a 2D array and
+            # stream it out with np.savetxt.
+            if len({data.dtype[name] for name in data.dtype.names}) == 1:
+                np.savetxt(
+                    csv_fn,
+                    data.view((data.dtype[0], len(data.dtype.names))),
+                    fmt="%.15g",
+                    delimiter=",",
+                    header=",".join(data.dtype.names),
+                    comments="",
+                )
+                return
+        else:
+            names = list(data.dtype.names)
+            arrays = [np.ascontiguousarray(data[name]) for name in names]
+            pa_csv.write_csv(pa.Table.from_arrays(arrays, names=names), csv_fn)
+            return
+    _write_csv(_data_to_df(data), csv_fn, float_format=float_format, engine=engine)
+
+
+def to_csv(
+    fn: str,
+    encoding: str = "windows-1252",
+    csv_fn: str = None,
+    float_format: str = None,
+    precision: str = "double",
+    engine: str = "auto",
+) -> None:
     """Extracts the data from an EC-Lab file and writes it to csv.
 
+    Settings files produce one csv file per linked technique, numbered
+    from the given base path. The technique files are written
+    concurrently, as the csv serialisation largely releases the GIL.
+
     Parameters
     ----------
     fn
@@ -150,17 +394,102 @@ def to_csv(fn: str, encoding: str = "windows-1252", csv_fn: str = None) -> None:
     csv_fn
         Base path to use for the csv file. Defaults to generate the csv
         file name from the input file name.
+    float_format
+        Format string for floats, e.g. "%.15f". Defaults to the
+        shortest representation that round-trips, which produces
+        smaller files than a fixed number of decimal places without
+        losing precision.
+    precision
+        Either "double" (default) or "single", see ``to_df``.
+    engine
+        Either "auto" (default, pyarrow with a pandas fallback) or
+        "polars", which writes through polars' Rust csv writer and
+        needs the polars package installed.
 
     """
-    df = to_df(fn, encoding=encoding)
     if csv_fn is None:
         csv_fn = _construct_fn(fn, ".csv")
-    df.to_csv(csv_fn, float_format="%.15f")
+    ext = _split_fn(fn)[2].lower()
+    if ext == ".mps":
+        # Write each technique's data as-is, skipping the DataFrame
+        # concat that to_df does for settings files.
+        techniques, __ = mps.process(
+            fn, encoding=encoding, load_data=True, load_type="mpr"
+        )
+        head, stem, __ = _split_fn(csv_fn)
+        jobs = [
+            (technique["data"], os.path.join(head, f"{stem}_{int(num):02d}.csv"))
+            for num, technique in techniques.items()
+            if "data" in technique
+        ]
+        with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+            list(
+                executor.map(
+                    lambda job: _write_data_csv(*job, float_format, precision, engine),
+                    jobs,
+                )
+            )
+    else:
+        df = to_df(fn, encoding=encoding, precision=precision)
+        _write_csv(df, csv_fn, float_format=float_format, engine=engine)
+
+
+def _append_df(workbook: openpyxl.Workbook, df: pd.DataFrame, title: str) -> None:
+    """Appends a DataFrame to a write-only workbook as a new sheet.
+
+    Parameters
+    ----------
+    workbook
+        A write-only openpyxl Workbook.
+    df
+        The DataFrame to write.
+    title
+        The title of the sheet to create.
+
+    """
+    sheet = workbook.create_sheet(title)
+    sheet.append(list(df.columns))
+    for row in df.itertuples(index=False, name=None):
+        sheet.append(row)
+
 
+def _sheet_dfs(df: pd.DataFrame) -> list[tuple[str, pd.DataFrame]]:
+    """Splits a DataFrame into sheet titles and per-sheet DataFrames.
 
-def to_excel(fn: str, encoding: str = "windows-1252", excel_fn: str = None) -> None:
+    Parameters
+    ----------
+    df
+        The DataFrame to split. A MultiIndex DataFrame from a settings
+        file produces one sheet per technique.
+
+    Returns
+    -------
+    list[tuple[str, pd.DataFrame]]
+        The sheet titles and corresponding DataFrames.
+
+    """
+    if isinstance(df.index, pd.MultiIndex):
+        return [
+            (f"Technique {num}", technique_df)
+            for num, technique_df in df.groupby(level="Technique")
+        ]
+    return [("Data", df)]
+
+
+def to_excel(
+    fn: str,
+    encoding: str = "windows-1252",
+    excel_fn: str = None,
+    engine: str = "openpyxl",
+    precision: str = "double",
+) -> None:
     """Extracts the data from an EC-Lab file and writes it to Excel.
 
+    By default the file is written through a write-only openpyxl
+    workbook, which streams rows to disk instead of building the
+    entire cell grid in memory like DataFrame.to_excel does. Settings
+    files produce one sheet per linked technique.
+
     Parameters
     ----------
     fn
@@ -168,9 +497,32 @@ def to_excel(fn: str, encoding: str = "windows-1252", excel_fn: str = None) -> N
     excel_fn
         Path to the Excel file to write. Defaults to generate the xlsx
         file name from the input file name.
+    engine
+        The library to write the file with, "openpyxl" (default) or
+        "pyexcelerate". The pyexcelerate engine takes whole columns at
+        once and is considerably faster on large files, but needs the
+        pyexcelerate package installed.
+    precision
+        Either "double" (default) or "single", see ``to_df``.
 
     """
-    df = to_df(fn, encoding=encoding)
+    df = to_df(fn, encoding=encoding, precision=precision)
     if excel_fn is None:
         excel_fn = _construct_fn(fn, ".xlsx")
-    df.to_excel(excel_fn)
+    sheets = _sheet_dfs(df)
+    if engine == "openpyxl":
+        workbook = openpyxl.Workbook(write_only=True)
+        for title, sheet_df in sheets:
+            _append_df(workbook, sheet_df, title)
+        workbook.save(excel_fn)
+    elif engine == "pyexcelerate":
+        # Imported on demand as pyexcelerate is an optional dependency.
+        from pyexcelerate import Workbook
+
+        workbook = Workbook()
+        for title, sheet_df in sheets:
+            data = [list(sheet_df.columns)] + sheet_df.values.tolist()
+            workbook.new_sheet(title, data=data)
+        workbook.save(excel_fn)
+    else:
+        raise ValueError(f"Unrecognized engine: {engine}")
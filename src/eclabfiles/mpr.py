@@ -27,8 +27,8 @@ log module and then an optional loop module.
     0x???? MODULE                  # Module magic.
     ...                            # Module 4.
 
-After splitting the entire file on `MODULE`, each module starts with a
-header that is structured like this (offsets from start of module):
+Each `MODULE` keyword is followed by a module header that is
+structured like this (offsets from start of module):
 
 .. code-block::
 
@@ -130,10 +130,11 @@ EC-Lab, etc. Here a quick overview (offsets from start of module data).
 
 Structure of Parsed Data
 ````````````````````````
-The `process` function returns a tuple of data and metadata. The data is
-structured into a list of dicts, i.e. [{column -> value}, ...,
-{column -> value}]. If the file contains a log module, each timestep
-will contain a POSIX timestamp in the `"uts"` column.
+The `process` function returns a tuple of data and metadata. The data
+is a NumPy structured array with one field per data column; packed
+flag bits are unpacked into one uint8 field per flag. If the file
+contains a log module, the array will contain a POSIX timestamp in
+the `"uts"` field.
 
 The metadata dict is structured as follows:
 
@@ -183,7 +184,10 @@ The metadata dict is structured as follows:
 
 .. codeauthor:: Nicolas Vetsch <vetschnicolas@gmail.com>
 """
+import functools
 import logging
+import mmap
+import struct
 import warnings
 from datetime import datetime, timedelta
 from typing import Any
@@ -194,6 +198,41 @@ from eclabfiles.techniques import technique_params_dtypes
 
 logger = logging.getLogger(__name__)
 
+# Technique parameters live at one of a few known offsets, depending on
+# the technique and, apparently, the EC-Lab version. Explode the
+# candidate (offset, dtype) combinations per technique ID once at
+# import time, so the run-time search is one lookup and a first-match
+# scan.
+technique_params_table = {
+    id: [
+        (offset, dtype)
+        for offset in (0x0572, 0x1845, 0x1846)
+        for dtype in (dtypes if isinstance(dtypes, list) else [dtypes])
+    ]
+    for id, (__, dtypes) in technique_params_dtypes.items()
+}
+
+# The data and loop modules start with a few scalar header values.
+# Precompiled Structs unpack those much cheaper than spinning up numpy
+# machinery for 1-5 bytes.
+data_header_struct = struct.Struct("<IB")
+loop_header_struct = struct.Struct("<I")
+
+# struct format equivalents of the simple scalar dtypes, letting
+# _read_value skip ndarray construction on single-value reads.
+scalar_formats = {
+    "|u1": "<B",
+    "<u2": "<H",
+    "<u4": "<I",
+    "<f4": "<f",
+    "<f8": "<d",
+}
+
+# File magic at the top of every .mpr file and the keyword that starts
+# each module.
+file_magic = b"BIO-LOGIC MODULAR FILE\x1a                         \x00\x00\x00\x00"
+module_marker = b"MODULE"
+
 # Module header starting after each MODULE keyword.
 module_header_dtype = np.dtype(
     [
@@ -204,6 +243,7 @@ module_header_dtype = np.dtype(
         ("date", "|S8"),
     ]
 )
+module_header_size = module_header_dtype.itemsize
 
 
 # Relates the offset in the settings data to the corresponding dtype and
@@ -341,6 +381,15 @@ data_columns = {
 }
 
 
+# Unified view of the two tables above: any column ID maps to a
+# (bitmask, name, dtype, unit) tuple, where bitmask is None for data
+# columns and dtype/unit are None for flag columns. This lets
+# _parse_columns resolve each ID with a single lookup.
+column_table = {
+    id: (bitmask, name, None, None) for id, (bitmask, name) in flag_columns.items()
+} | {id: (None, name, dtype, unit) for id, (dtype, name, unit) in data_columns.items()}
+
+
 # Relates the offset in log data to the corresponding dtype and name.
 # NOTE: The safety limits are maybe at 0x200?
 # NOTE: The log also seems to contain the settings again. These are left
@@ -364,6 +413,43 @@ log_dtypes = {
 }
 
 
+def _fixed_field_dtype(field_dtypes: dict) -> np.dtype:
+    """Assembles a structured dtype over the fixed-width fields.
+
+    The offsets of the fields are baked into the dtype, so that all of
+    them can be read with a single np.frombuffer call instead of one
+    buffer read per field. Pascal strings have no fixed width and are
+    left out; they are read separately.
+
+    Parameters
+    ----------
+    field_dtypes
+        One of the offset-keyed dtype maps above.
+
+    Returns
+    -------
+    np.dtype
+        The structured dtype covering the fixed-width fields.
+
+    """
+    fixed = {
+        offset: (dtype, name)
+        for offset, (dtype, name) in field_dtypes.items()
+        if dtype != "pascal"
+    }
+    return np.dtype(
+        {
+            "names": [name for __, name in fixed.values()],
+            "formats": [dtype for dtype, __ in fixed.values()],
+            "offsets": list(fixed.keys()),
+        }
+    )
+
+
+settings_fixed_dtype = _fixed_field_dtype(settings_dtypes)
+log_fixed_dtype = _fixed_field_dtype(log_dtypes)
+
+
 def ole_to_posix(ole_timestamp: float) -> float:
     """Converts a Microsoft OLE timestamp into a POSIX timestamp.
 
@@ -408,7 +494,7 @@ def _read_pascal_string(pascal_bytes: bytes, encoding: str = "windows-1252") ->
     """
     if len(pascal_bytes) < pascal_bytes[0] + 1:
         raise ValueError("Insufficient number of bytes.")
-    string_bytes = pascal_bytes[1 : pascal_bytes[0] + 1]
+    string_bytes = bytes(pascal_bytes[1 : pascal_bytes[0] + 1])
     return string_bytes.decode(encoding)
 
 
@@ -444,6 +530,10 @@ def _read_value(
     if dtype == "pascal":
         # Allow the use of 'pascal' in all of the dtype maps.
         return _read_pascal_string(data[offset:])
+    if isinstance(dtype, str) and dtype in scalar_formats:
+        # Simple scalars unpack around 5x faster through struct than
+        # through a one-element ndarray.
+        return struct.unpack_from(scalar_formats[dtype], data, offset)[0]
     value = np.frombuffer(data, offset=offset, dtype=dtype, count=1)
     item = value.item()
     if value.dtype.names:
@@ -501,23 +591,25 @@ def _process_settings(data: bytes) -> tuple[dict, list]:
     """
     settings = {}
     # First parse the settings right at the top of the data block.
-    technique, params_dtype = technique_params_dtypes[data[0x0000]]
+    technique, __ = technique_params_dtypes[data[0x0000]]
     settings["technique"] = technique
+    # All fixed-width fields come out of a single buffer read; only the
+    # variable-length pascal strings need separate reads.
+    fixed = _read_value(data, 0x0000, settings_fixed_dtype)
     for offset, (dtype, name) in settings_dtypes.items():
-        settings[name] = _read_value(data, offset, dtype)
-    # Then determine the technique parameters. The parameters' offset
-    # changes depending on the technique present and apparently on some
-    # other factor that is unclear to me.
-    params_offset = None
-    for offset in (0x0572, 0x1845, 0x1846):
-        n_params = _read_value(data, offset + 0x0002, "<u2")
-        if isinstance(params_dtype, list):
-            # The params_dtype has multiple possible lengths if a list.
-            for dtype in params_dtype:
-                if len(dtype) == n_params:
-                    params_dtype, params_offset = dtype, offset
-        elif len(params_dtype) == n_params:
-            params_offset = offset
+        settings[name] = (
+            _read_pascal_string(data[offset:]) if dtype == "pascal" else fixed[name]
+        )
+    # Then determine the technique parameters by probing the candidate
+    # (offset, dtype) combinations and taking the first whose number of
+    # parameters matches what is stored in the file.
+    params_dtype = params_offset = None
+    n_params_at = {}
+    for offset, dtype in technique_params_table[data[0x0000]]:
+        if offset not in n_params_at:
+            n_params_at[offset] = _read_value(data, offset + 0x0002, "<u2")
+        if n_params_at[offset] == len(dtype):
+            params_dtype, params_offset = dtype, offset
             break
     if params_offset is None:
         raise NotImplementedError("Unknown parameter offset or technique dtype.")
@@ -526,8 +618,14 @@ def _process_settings(data: bytes) -> tuple[dict, list]:
     return settings, params
 
 
-def _parse_columns(column_ids: list[int]) -> tuple[list, list, list, dict]:
-    """Puts together column info from a list of data column IDs.
+@functools.lru_cache(maxsize=None)
+def _parse_columns(column_ids: tuple[int, ...]) -> tuple[np.dtype, dict, dict]:
+    """Puts together column info from a tuple of data column IDs.
+
+    Files sharing the same acquisition channels repeat the exact same
+    column ID sequence, so the assembled dtype is cached on it. There
+    are only a handful of realistic column combinations, hence the
+    unbounded cache.
 
     Note
     ----
@@ -538,39 +636,69 @@ def _parse_columns(column_ids: list[int]) -> tuple[list, list, list, dict]:
     Parameters
     ----------
     column_ids
-        A list of column IDs.
+        A tuple of column IDs.
 
     Returns
     -------
-    tuple[list, list, list, dict]
-        The column names, dtypes, units and a dictionary of flag names
-        and bitmasks.
+    tuple[np.dtype, dict, dict]
+        The assembled dtype of a datapoint, the units indexed by
+        column name and a dictionary of flag names and bitmasks.
 
     """
     names = []
     dtypes = []
     units = []
     flags = {}
+    flags_added = False
     for id in column_ids:
-        if id in flag_columns:
-            bitmask, name = flag_columns[id]
+        try:
+            bitmask, name, dtype, unit = column_table[id]
+        except KeyError:
+            raise NotImplementedError(f"Unknown column ID: {id}") from None
+        if bitmask is not None:
             flags[name] = bitmask
             # Flags column only needs to be added once.
-            if "flags" not in names:
+            if not flags_added:
                 names.append("flags")
                 dtypes.append("|u1")
                 units.append(None)
-        elif id in data_columns:
-            dtype, name, unit = data_columns[id]
+                flags_added = True
+        else:
             names.append(name)
             dtypes.append(dtype)
             units.append(unit)
-        else:
-            raise NotImplementedError(f"Unknown column ID: {id}")
-    return names, dtypes, units, flags
+    return np.dtype(list(zip(names, dtypes))), dict(zip(names, units)), flags
+
+
+@functools.lru_cache(maxsize=None)
+def _unpacked_dtype(data_dtype: np.dtype, flag_names: tuple[str, ...]) -> np.dtype:
+    """Builds the output dtype with flags expanded into uint8 fields.
+
+    Cached alongside _parse_columns, so that processing many files
+    with the same column layout sets up each dtype only once.
+
+    Parameters
+    ----------
+    data_dtype
+        The dtype of a raw datapoint as read from the file.
+    flag_names
+        The names of the flags packed into the flags field.
 
+    Returns
+    -------
+    np.dtype
+        The datapoint dtype with the flags field replaced by one uint8
+        field per flag.
+
+    """
+    fields = [
+        (name, data_dtype[name].str) for name in data_dtype.names if name != "flags"
+    ]
+    fields += [(name, "|u1") for name in flag_names]
+    return np.dtype(fields)
 
-def _process_data(data: bytes, version: int) -> tuple[list, dict]:
+
+def _process_data(data: bytes, version: int) -> tuple[np.ndarray, dict]:
     """Processes the contents of data modules.
 
     Parameters
@@ -582,18 +710,17 @@ def _process_data(data: bytes, version: int) -> tuple[list, dict]:
 
     Returns
     -------
-    tuple[dict, dict]
-        A dictionary containing the datapoints in records format
-        ([{column -> value}, ..., {column -> value}]) and a dictionary
-        containing the units indexed by the columns.
+    tuple[np.ndarray, dict]
+        A structured array containing the datapoints with one field
+        per column and a dictionary containing the units indexed by
+        the columns. Packed flag bits are unpacked into one uint8
+        field per flag.
 
     """
-    n_datapoints = _read_value(data, 0x0000, "<u4")
-    n_columns = _read_value(data, 0x0004, "|u1")
-    column_ids = _read_values(data, 0x0005, "<u2", n_columns)
+    n_datapoints, n_columns = data_header_struct.unpack_from(data, 0x0000)
+    column_ids = np.frombuffer(data, offset=0x0005, dtype="<u2", count=n_columns)
     # Length of each datapoint depends on number and IDs of columns.
-    names, dtypes, units, flags = _parse_columns(column_ids)
-    data_dtype = np.dtype(list(zip(names, dtypes)))
+    data_dtype, units, flags = _parse_columns(tuple(column_ids))
     # Depending on module version, datapoints start at 0x0195 or 0x0196.
     if version == 2:
         offset = 0x0195
@@ -601,17 +728,25 @@ def _process_data(data: bytes, version: int) -> tuple[list, dict]:
         offset = 0x0196
     else:
         raise NotImplementedError(f"Unknown data module version: {version}")
-    datapoints = _read_values(data, offset, data_dtype, n_datapoints)
+    datapoints = np.frombuffer(data, offset=offset, dtype=data_dtype, count=n_datapoints)
     if flags:
-        for datapoint in datapoints:
-            flag_bits = datapoint.pop("flags")
-            for name, bitmask in flags.items():
-                # Two's complement hack to find the position of the
-                # rightmost set bit.
-                shift = (bitmask & -bitmask).bit_length() - 1
-                # Rightshift flag by that amount.
-                datapoint[name] = (flag_bits & bitmask) >> shift
-    return datapoints, dict(zip(names, units))
+        # Unpack the flags byte into one field per flag with vectorized
+        # bitwise ops on the whole column at once.
+        unpacked = np.empty(n_datapoints, dtype=_unpacked_dtype(data_dtype, tuple(flags)))
+        for name in data_dtype.names:
+            if name != "flags":
+                unpacked[name] = datapoints[name]
+        flag_bits = datapoints["flags"]
+        for name, bitmask in flags.items():
+            # Two's complement hack to find the position of the
+            # rightmost set bit.
+            shift = (bitmask & -bitmask).bit_length() - 1
+            # Rightshift flag by that amount.
+            unpacked[name] = (flag_bits & bitmask) >> shift
+        datapoints = unpacked
+    # Copy the units so that callers mutating the returned metadata do
+    # not write into the dict memoized by _parse_columns.
+    return datapoints, dict(units)
 
 
 def _process_log(data: bytes) -> dict:
@@ -629,8 +764,11 @@ def _process_log(data: bytes) -> dict:
 
     """
     log = {}
+    fixed = _read_value(data, 0x0000, log_fixed_dtype)
     for offset, (dtype, name) in log_dtypes.items():
-        log[name] = _read_value(data, offset, dtype)
+        log[name] = (
+            _read_pascal_string(data[offset:]) if dtype == "pascal" else fixed[name]
+        )
     # Convert the file's OLE timestamp to a POSIX timestamp.
     log["posix_timestamp"] = ole_to_posix(log["ole_timestamp"])
     return log
@@ -650,12 +788,24 @@ def _process_loop(data: bytes) -> dict:
         The parsed loops.
 
     """
-    n_indexes = _read_value(data, 0x0000, "<u4")
-    indexes = _read_values(data, 0x0004, "<u4", n_indexes)
-    return {"n_indexes": n_indexes, "indexes": indexes}
+    (n_indexes,) = loop_header_struct.unpack_from(data, 0x0000)
+    indexes = np.frombuffer(data, offset=0x0004, dtype="<u4", count=n_indexes)
+    return {"n_indexes": n_indexes, "indexes": indexes.tolist()}
+
+
+# Maps the module's short name to the corresponding parsing function.
+# All parsers share a (data, header) signature so that modules can be
+# dispatched with a single dict lookup instead of a chain of string
+# comparisons.
+module_parsers = {
+    "VMP Set": lambda data, header: _process_settings(data),
+    "VMP data": lambda data, header: _process_data(data, header["version"]),
+    "VMP LOG": lambda data, header: _process_log(data),
+    "VMP loop": lambda data, header: _process_loop(data),
+}
 
 
-def process(fn: str, encoding: str = "windows-1252") -> tuple[list, dict]:
+def process(fn: str, encoding: str = "windows-1252") -> tuple[np.ndarray, dict]:
     """Processes EC-Lab raw data binary files.
 
     Parameters
@@ -667,31 +817,50 @@ def process(fn: str, encoding: str = "windows-1252") -> tuple[list, dict]:
 
     Returns
     -------
-    tuple[list, dict]
+    tuple[np.ndarray, dict]
         Tuple containing the data and metadata.
 
+    Notes
+    -----
+    When the file carries neither flag columns nor a log module, the
+    returned data is a read-only view straight into the memory-mapped
+    file: nothing beyond the touched pages is ever allocated, which
+    keeps files larger than RAM workable. The map stays alive through
+    the array's buffer reference. Call ``.copy()`` on the array if you
+    need to mutate it. Flag unpacking and the uts column otherwise
+    produce a regular writable array.
+
     """
-    file_magic = b"BIO-LOGIC MODULAR FILE\x1a                         \x00\x00\x00\x00"
+    # Memory-map the file so that module payloads can be handed to the
+    # parsers as zero-copy views; the bulk data is then wrapped by
+    # np.frombuffer without ever copying it.
     with open(fn, "rb") as mpr_file:
-        assert mpr_file.read(len(file_magic)) == file_magic, "Invalid file magic."
-        mpr = mpr_file.read()
-    # Process modules.
-    modules = mpr.split(b"MODULE")[1:]
-    settings = data = log = loop = None
-    for module in modules:
-        header = _read_value(module, 0x0000, module_header_dtype)
+        mpr = mmap.mmap(mpr_file.fileno(), 0, access=mmap.ACCESS_READ)
+    assert mpr[: len(file_magic)] == file_magic, "Invalid file magic."
+    view = memoryview(mpr)
+    # Collect the module slices first by walking the module markers.
+    modules = []
+    pos = mpr.find(module_marker, len(file_magic))
+    while pos != -1:
+        header = _read_value(mpr, pos + len(module_marker), module_header_dtype)
         name = header["short_name"].strip()
-        module_data = module[module_header_dtype.itemsize :]
-        if name == "VMP Set":
-            settings, params = _process_settings(module_data)
-        elif name == "VMP data":
-            data, units = _process_data(module_data, header["version"])
-        elif name == "VMP LOG":
-            log = _process_log(module_data)
-        elif name == "VMP loop":
-            loop = _process_loop(module_data)
-        else:
+        if name not in module_parsers:
             raise NotImplementedError(f"Unknown module: {name}.")
+        next_pos = mpr.find(module_marker, pos + len(module_marker))
+        end = len(mpr) if next_pos == -1 else next_pos
+        modules.append(
+            (name, header, view[pos + len(module_marker) + module_header_size : end])
+        )
+        pos = next_pos
+    # Results are keyed by short name, so repeated modules keep only the
+    # last one, as they always have.
+    results = {
+        name: module_parsers[name](data, header) for name, header, data in modules
+    }
+    settings, params = results.get("VMP Set", (None, None))
+    data, units = results.get("VMP data", (None, None))
+    log = results.get("VMP LOG")
+    loop = results.get("VMP loop")
     # Populate metadata.
     meta = {}
     if settings is not None and params is not None:
@@ -704,9 +873,13 @@ def process(fn: str, encoding: str = "windows-1252") -> tuple[list, dict]:
         raise ValueError("No data present in file.")
     if log is not None:
         meta["log"] = log
-        posix_timestamp = log["posix_timestamp"]
-        for d in data:
-            d["uts"] = posix_timestamp + d["time"]
+        # Append a timestamp field and fill it in one vectorized add.
+        uts_dtype = np.dtype(data.dtype.descr + [("uts", "<f8")])
+        timestamped = np.empty(data.shape, dtype=uts_dtype)
+        for column in data.dtype.names:
+            timestamped[column] = data[column]
+        timestamped["uts"] = data["time"] + log["posix_timestamp"]
+        data = timestamped
     else:
         warnings.warn("No log present in file. Data will not contain absolute time.")
     if loop is not None:
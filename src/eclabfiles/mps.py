@@ -41,12 +41,13 @@ files.
 
 .. codeauthor:: Nicolas Vetsch <vetschnicolas@gmail.com>
 """
-import glob
+import copy
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 
 from eclabfiles import mpr, mpt
-from eclabfiles.techniques import technique_params
+from eclabfiles.techniques import param_values, technique_params
 
 
 def _process_techniques(techniques: list[str]) -> dict:
@@ -65,22 +66,10 @@ def _process_techniques(techniques: list[str]) -> dict:
     """
     processed_techniques = {}
     for technique in techniques:
-        technique_num, technique_name, *params = technique.split("\n")
+        technique_num, technique_name, *params = technique.splitlines()
         technique_num = technique_num.split(" : ")[-1]
         technique, params_keys = technique_params(technique_name, params)
-        # The sequence param columns are always allocated 20 characters.
-        n_sequences = int(len(params[0]) / 20)
-        params_values = []
-        for seq in range(1, n_sequences):
-            values = []
-            for param in params:
-                try:
-                    val = float(param[seq * 20 : (seq + 1) * 20])
-                except ValueError:
-                    val = param[seq * 20 : (seq + 1) * 20].strip()
-                values.append(val)
-            params_values.append(values)
-        params = [dict(zip(params_keys, values)) for values in params_values]
+        params = [dict(zip(params_keys, values)) for values in param_values(params)]
         processed_techniques[technique_num] = {
             "technique": technique,
             "params": params,
@@ -88,6 +77,42 @@ def _process_techniques(techniques: list[str]) -> dict:
     return processed_techniques
 
 
+# Small cache of parsed data files so that repeatedly loading the same
+# settings file (e.g. re-running an analysis notebook cell) does not
+# re-parse unchanged siblings. Keyed on the file's stat info to
+# invalidate whenever a file changes on disk.
+_parse_cache = {}
+_parse_cache_size = 32
+
+
+def _cached_process(parser, path: str) -> tuple:
+    """Parses a data file through the stat-keyed cache.
+
+    Parameters
+    ----------
+    parser
+        The process function of the matching parser module.
+    path
+        The path of the data file to parse.
+
+    Returns
+    -------
+    tuple
+        The data and metadata parsed from the file.
+
+    """
+    stat = os.stat(path)
+    key = (os.path.abspath(path), stat.st_mtime_ns, stat.st_size)
+    if key not in _parse_cache:
+        if len(_parse_cache) >= _parse_cache_size:
+            _parse_cache.pop(next(iter(_parse_cache)))
+        _parse_cache[key] = parser(path)
+    data, meta = _parse_cache[key]
+    # Hand out a copy of the metadata so that mutations on one
+    # processed settings file do not show up in later cache hits.
+    return data, copy.deepcopy(meta)
+
+
 def _load_technique_data(
     filename: str, techniques: dict, load_type: str = None
 ) -> dict:
@@ -123,20 +148,35 @@ def _load_technique_data(
     # NOTE: It's assumed that sorting your data files by name puts them
     # in the order in which they appear in the settings file.
     if load_type == "mpr":
-        mpr_paths = sorted(glob.glob(base_path + "*.mpr"))
-        if len(expected_techniques) != len(mpr_paths):
-            raise ValueError("Data incomplete.")
-        data, meta = [list(t) for t in zip(*[mpr.process(path) for path in mpr_paths])]
+        parser = mpr.process
     elif load_type == "mpt":
-        mpt_paths = sorted(glob.glob(base_path + "*.mpt"))
-        if len(expected_techniques) != len(mpt_paths):
-            raise ValueError("Data incomplete.")
-        data, meta = [list(t) for t in zip(*[mpt.process(path) for path in mpt_paths])]
+        parser = mpt.process
     else:
         raise ValueError(f"Unrecognised load_type: {load_type}")
-    for num in expected_techniques:
-        techniques[num]["data"] = data.pop(0)
-        techniques[num]["meta"] = meta.pop(0)
+    # A single scandir pass beats glob here: the experiment folder can
+    # hold thousands of files and scandir filters them in one
+    # directory read.
+    dirname, basename = os.path.split(base_path)
+    with os.scandir(dirname or ".") as entries:
+        paths = sorted(
+            entry.path
+            for entry in entries
+            if entry.name.startswith(basename)
+            and entry.name.endswith("." + load_type)
+        )
+    if len(expected_techniques) != len(paths):
+        raise ValueError("Data incomplete.")
+    # The data files are independent of each other, so parse them on a
+    # thread pool. Both parsers spend their time in np.frombuffer,
+    # vectorized NumPy ops and the csv tokenizer, all of which release
+    # the GIL, and threads avoid pickling the arrays back. map()
+    # preserves the input order.
+    with ThreadPoolExecutor(max_workers=min(len(paths), os.cpu_count())) as executor:
+        results = executor.map(lambda path: _cached_process(parser, path), paths)
+        data, meta = [list(t) for t in zip(*results)]
+    for num, technique_data, technique_meta in zip(expected_techniques, data, meta):
+        techniques[num]["data"] = technique_data
+        techniques[num]["meta"] = technique_meta
     return techniques
 
 
@@ -168,9 +208,11 @@ def process(
 
     """
     file_magic = "EC-LAB SETTING FILE\n"
+    # Read the file in a single pass and validate the magic in-buffer.
     with open(fn, "r", encoding=encoding) as mps_file:
-        assert mps_file.readline() == file_magic, "Invalid file magic."
         mps = mps_file.read()
+    assert mps.startswith(file_magic), "Invalid file magic."
+    mps = mps[len(file_magic) :]
     n_linked_techniques, filename, settings, *techniques = mps.split("\n\n")
     n_linked_techniques = int(n_linked_techniques.strip().split()[-1])
     assert len(techniques) == n_linked_techniques, "Inconsistent file."
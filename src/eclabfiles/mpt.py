@@ -13,10 +13,11 @@ settings, log and loop modules of the binary `.mpr` file.
 Structure of Parsed Data
 ````````````````````````
 
-The `process` function returns a tuple of data and metadata. The data is
-structured into a list of dicts, i.e. [{column -> value}, ...,
-{column -> value}]. If the file contains a settings header, each
-timestep will contain a POSIX timestamp in the `"uts"` column.
+The `process` function returns a tuple of data and metadata. The data
+is a NumPy structured array with one field per data column, i.e. the
+values of every column are stored contiguously. If the file contains a
+settings header, the array will contain a POSIX timestamp in the
+`"uts"` field.
 
 The metadata dict is structured as follows:
 
@@ -42,13 +43,19 @@ The metadata dict is structured as follows:
 
 .. codeauthor:: Nicolas Vetsch <vetschnicolas@gmail.com>
 """
+import functools
 import logging
+import mmap
 import re
 import warnings
+from datetime import datetime
+from io import BytesIO
 
+import numpy as np
+import pandas as pd
 from dateutil import parser as dateparser
 
-from eclabfiles.techniques import technique_params
+from eclabfiles.techniques import param_values, technique_params
 
 logger = logging.getLogger(__name__)
 
@@ -131,12 +138,8 @@ column_units = {
     "R/Ohm": ("R", "Ohm"),
     "Rcmp/Ohm": ("Rcmp", "Ohm"),
     "Re(Y)/Ohm-1": ("Re(Y)", "S"),
-    "Re(Y)/Ohm-1": ("Re(Y)", "S"),
-    "Re(Z)/Ohm": ("Re(Z)", "Ohm"),
     "Re(Z)/Ohm": ("Re(Z)", "Ohm"),
     "Re(Zce)/Ohm": ("Re(Zce)", "Ohm"),
-    "Re(Zce)/Ohm": ("Re(Zce)", "Ohm"),
-    "Re(Zwe-ce)/Ohm": ("Re(Zwe-ce)", "Ohm"),
     "Re(Zwe-ce)/Ohm": ("Re(Zwe-ce)", "Ohm"),
     "step time/s": ("step time", "s"),
     "THD Ewe/%": ("THD Ewe", "%"),
@@ -147,6 +150,96 @@ column_units = {
 }
 
 
+@functools.lru_cache(maxsize=None)
+def _resolve_column(name: str) -> tuple[str, str]:
+    """Resolves a raw column name into a proper name and unit.
+
+    Known names come straight out of the column_units table. Unknown
+    names are split on their trailing /unit suffix instead of raising,
+    so columns from newer EC-Lab versions still parse. The resolution
+    is cached since files repeat the same handful of columns.
+
+    Parameters
+    ----------
+    name
+        The raw column name from the line atop the datalines.
+
+    Returns
+    -------
+    tuple[str, str]
+        The proper column name and its unit, None if unitless.
+
+    """
+    try:
+        return column_units[name]
+    except KeyError:
+        quantity, sep, unit = name.rpartition("/")
+        if sep:
+            return quantity, unit
+        return name, None
+
+
+# Acquisition timestamp formats observed in the wild, most common
+# first.
+_timestamp_formats = (
+    "%m/%d/%Y %H:%M:%S",
+    "%m/%d/%Y %H:%M:%S.%f",
+    "%m.%d.%Y %H:%M:%S",
+)
+
+
+def _parse_timestamp(value: str) -> datetime:
+    """Parses the acquisition timestamp.
+
+    Tries the known formats with strptime first, which is orders of
+    magnitude cheaper than dateutil's fuzzy parser; the latter stays
+    as the fallback for formats not seen before.
+
+    Parameters
+    ----------
+    value
+        The timestamp from the "Acquisition started on" line.
+
+    Returns
+    -------
+    datetime
+        The parsed timestamp.
+
+    """
+    for fmt in _timestamp_formats:
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    return dateparser.parse(value, dayfirst=False)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_names(names: tuple[str, ...]) -> tuple[tuple, dict, np.dtype]:
+    """Resolves all column names of a data header at once.
+
+    Batch analyses parse many files sharing the same columns, so the
+    resolved names, units and assembled dtype are cached on the full
+    names tuple.
+
+    Parameters
+    ----------
+    names
+        A tuple of the raw column names from the line atop the
+        datalines.
+
+    Returns
+    -------
+    tuple[tuple, dict, np.dtype]
+        The proper column names, the units indexed by column name and
+        the structured dtype of a datapoint.
+
+    """
+    columns, units = zip(*[_resolve_column(name) for name in names])
+    data_dtype = np.dtype([(column, "<f8") for column in columns])
+    return columns, dict(zip(columns, units)), data_dtype
+
+
 def _process_header(lines: list[str]) -> tuple[dict, list, dict]:
     """Processes the header lines.
 
@@ -170,32 +263,18 @@ def _process_header(lines: list[str]) -> tuple[dict, list, dict]:
         logger.info("File only contains a loop section.")
     # Again, we need the acquisition time to get timestamped data.
     technique = sections[1].strip()
-    settings_lines = sections[2].split("\n")
+    settings_lines = sections[2].splitlines()
     technique, params_keys = technique_params(technique, settings_lines)
     params = settings_lines[-len(params_keys) :]
-    # The sequence param columns are always allocated 20 characters.
-    n_sequences = int(len(params[0]) / 20)
-    params_values = []
-    for seq in range(1, n_sequences):
-        values = []
-        for param in params:
-            try:
-                val = float(param[seq * 20 : (seq + 1) * 20])
-            except ValueError:
-                val = param[seq * 20 : (seq + 1) * 20].strip()
-            values.append(val)
-        params_values.append(values)
-    params = [dict(zip(params_keys, values)) for values in params_values]
+    params = [dict(zip(params_keys, values)) for values in param_values(params)]
     settings_lines = [line.strip() for line in settings_lines[: -len(params_keys)]]
     # Parse the acquisition timestamp.
-    # NOTE: These are the formats I have seen:
-    # "%m/%d/%Y %H:%M:%S", "%m.%d.%Y %H:%M:%S", "%m/%d/%Y %H:%M:%S.%f"
     timestamp_re = re.compile(r"Acquisition started on : (?P<val>.+)")
     timestamp_match = timestamp_re.search("\n".join(settings_lines))
-    timestamp = dateparser.parse(timestamp_match["val"], dayfirst=False)
+    timestamp = _parse_timestamp(timestamp_match["val"])
     if sections[-1].startswith("Number of loops : "):
         # The header contains a loops section.
-        loops_lines = sections[-1].split("\n")
+        loops_lines = sections[-1].splitlines()
         n_loops = int(loops_lines[0].split(":")[-1])
         indexes = []
         for n in range(n_loops):
@@ -209,40 +288,54 @@ def _process_header(lines: list[str]) -> tuple[dict, list, dict]:
     return settings, params, loops
 
 
-def _process_data(lines: list[str]) -> tuple[list, dict]:
-    """Processes the data lines.
+def _process_data(names: list[str], data: bytes, encoding: str) -> tuple[np.ndarray, dict]:
+    """Processes the data block.
 
     Parameters
     ----------
-    lines
-        The data lines, starting right after the last header section.
-        The first line is an empty line, the column names can be found
-        on the second line.
+    names
+        The raw column names from the line atop the datalines.
+    data
+        The raw, undecoded bytes of the datalines.
+    encoding
+        Encoding of ``data``.
 
     Returns
     -------
-    tuple[dict, dict]
-        A dictionary containing the datapoints in records format
-        ([{column -> value}, ..., {column -> value}]) and a dictionary
-        containing the units indexed by the columns.
+    tuple[np.ndarray, dict]
+        A structured array containing the datapoints with one field
+        per column and a dictionary containing the units indexed by
+        the columns.
 
     """
-    # At this point the first two lines have already been read.
-    # Remove extra column due to an extra tab in .mpt file column names.
-    names = lines[1].split("\t")[:-1]
-    columns, units = zip(*[column_units[n] for n in names])
-    data_lines = lines[2:]
-    datapoints = []
-    for line in data_lines:
-        values = line.split("\t")
-        datapoint = {}
-        for col, val in list(zip(columns, values)):
-            datapoint[col] = float(val)
-        datapoints.append(datapoint)
-    return datapoints, dict(zip(columns, units))
-
-
-def process(fn: str, encoding: str = "windows-1252") -> tuple[list, dict]:
+    columns, units, data_dtype = _resolve_names(tuple(names))
+    # Tokenizing and float-parsing the datalines is the dominant cost
+    # here, so hand the whole block to the C parser in one go. The
+    # parser decodes the bytes itself, so the bulk of the file never
+    # exists as Python strings.
+    frame = pd.read_csv(
+        BytesIO(data),
+        sep="\t",
+        header=None,
+        names=columns,
+        usecols=range(len(columns)),
+        engine="c",
+        dtype="<f8",
+        encoding=encoding,
+        # The default float converter truncates long decimal
+        # expansions; round_trip keeps the values bit-identical to
+        # float() on the same text.
+        float_precision="round_trip",
+    )
+    datapoints = np.empty(len(frame), dtype=data_dtype)
+    for column in columns:
+        datapoints[column] = frame[column].to_numpy()
+    # Copy the units so that callers mutating the returned metadata do
+    # not write into the dict memoized by _resolve_names.
+    return datapoints, dict(units)
+
+
+def process(fn: str, encoding: str = "windows-1252") -> tuple[np.ndarray, dict]:
     """Processes EC-Lab human-readable text export files.
 
     Parameters
@@ -254,31 +347,54 @@ def process(fn: str, encoding: str = "windows-1252") -> tuple[list, dict]:
 
     Returns
     -------
-    (data, metadata) : tuple[list, dict]
+    (data, metadata) : tuple[np.ndarray, dict]
         Tuple containing the timesteps and metadata
 
     """
-    file_magic = "EC-Lab ASCII FILE\n"
-    with open(fn, "r", encoding=encoding) as mpt_file:
-        assert mpt_file.readline() == file_magic, "Invalid file magic."
-        mpt = mpt_file.read()
-    lines = mpt.split("\n")
-    nb_header_lines = int(lines[0].split()[-1])
+    # The magic is matched without the line ending so that files with
+    # CRLF endings pass too; text mode used to normalize those.
+    file_magic = b"EC-Lab ASCII FILE"
+    # Memory-map the file and only ever decode the header: the bulk of
+    # the file is the datalines, which go to the csv parser as raw
+    # bytes.
+    with open(fn, "rb") as mpt_file:
+        mpt = mmap.mmap(mpt_file.fileno(), 0, access=mmap.ACCESS_READ)
+    assert mpt[: len(file_magic)] == file_magic, "Invalid file magic."
+    magic_end = mpt.find(b"\n", len(file_magic)) + 1
+    nb_end = mpt.find(b"\n", magic_end)
+    nb_header_lines = int(mpt[magic_end:nb_end].split()[-1])
     if nb_header_lines < 3:
         raise ValueError(f"Invalid file structure: {fn}")
-    header_lines = lines[: nb_header_lines - 3]
+    # Walk to the end of the header, then decode it in one piece.
+    pos = magic_end
+    for __ in range(nb_header_lines - 3):
+        pos = mpt.find(b"\n", pos) + 1
+    header_lines = mpt[magic_end:pos].decode(encoding).splitlines()
     settings, params, loops = _process_header(header_lines)
-    data_lines = lines[nb_header_lines - 3 :]
-    data, units = _process_data(data_lines)
+    # An empty line, then the column names, then the datalines.
+    names_start = mpt.find(b"\n", pos) + 1
+    names_end = mpt.find(b"\n", names_start)
+    if names_end == -1:
+        # Truncated export: the names line ends the file, so there are
+        # no datalines behind it.
+        names_end = len(mpt)
+    names_line = mpt[names_start:names_end].decode(encoding).rstrip("\r")
+    # Remove extra column due to an extra tab in .mpt file column names.
+    names = names_line.split("\t")[:-1]
+    data, units = _process_data(names, mpt[names_end + 1 :], encoding)
     # Populate metadata.
     meta = {}
     if settings is not None and params is not None:
         meta["raw"] = "\n".join(header_lines)
         meta["settings"] = settings
         meta["params"] = params
-        posix_timestamp = settings["posix_timestamp"]
-        for d in data:
-            d["uts"] = posix_timestamp + d["time"]
+        # Append a timestamp field and fill it in one vectorized add.
+        uts_dtype = np.dtype(data.dtype.descr + [("uts", "<f8")])
+        timestamped = np.empty(data.shape, dtype=uts_dtype)
+        for column in data.dtype.names:
+            timestamped[column] = data[column]
+        timestamped["uts"] = data["time"] + settings["posix_timestamp"]
+        data = timestamped
     else:
         warnings.warn("No settings and params present in file.")
     if data is not None and units is not None:
@@ -947,6 +947,58 @@ def technique_params(technique: str, settings: list[str]) -> tuple[str, list]:
     raise NotImplementedError(f"'{technique}' not implemented.")
 
 
+# Characters a numeric parameter value can start with. Checking the
+# first character before attempting float() skips the costly raise and
+# catch on obviously textual cells.
+_numeric_start = frozenset("+-.0123456789")
+
+
+def param_values(params: list[str]) -> list[list]:
+    """Parses the sequence values out of fixed-width parameter lines.
+
+    Both .mpt and .mps headers lay the technique parameters out in
+    lines whose sequence columns are always allocated 20 characters,
+    with the parameter name in the first cell. Each line is viewed as
+    fixed-width cells in a single reinterpretation, and all-numeric
+    parameter rows convert in one vectorized pass.
+
+    Parameters
+    ----------
+    params
+        The fixed-width technique parameter lines.
+
+    Returns
+    -------
+    list[list]
+        One list of parameter values per sequence.
+
+    """
+    n_sequences = int(len(params[0]) / 20)
+    width = n_sequences * 20
+    columns = []
+    for param in params:
+        # Lines can come up short of the width implied by the first
+        # one, e.g. when an unpadded last cell ends the line; pad them
+        # so the fixed-width view always divides evenly.
+        cells = np.array([param[:width].ljust(width)]).view("<U20")[1:]
+        stripped = np.char.strip(cells)
+        try:
+            # Usually all sequence values of a parameter are numeric
+            # and convert in one vectorized pass.
+            column = stripped.astype("<f8").tolist()
+        except ValueError:
+            column = []
+            for cell in stripped.tolist():
+                if cell[:1] in _numeric_start:
+                    try:
+                        cell = float(cell)
+                    except ValueError:
+                        pass
+                column.append(cell)
+        columns.append(column)
+    return [list(values) for values in zip(*columns)]
+
+
 # Maps the technique byte to its corresponding dtype.
 technique_params_dtypes = {
     0x04: ("GCPL", _gcpl_params_dtype),